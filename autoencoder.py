@@ -1,11 +1,11 @@
 
 import os
 import pickle
+from math import prod
 
 import keras as ks
 from keras import Model, Input
 #from keras import backend as K
-import numpy as np
 import tensorflow as tf
 
 
@@ -172,7 +172,7 @@ class VAE:
     
 
     def _add_dense_layer(self, decoder_input):
-        num_neurons = np.prod(self._shape_before_bottleneck)
+        num_neurons = prod( int(dim) for dim in self._shape_before_bottleneck )
         dense_layer = ks.layers.Dense(num_neurons, name="decoder_dense")(decoder_input)
         return dense_layer
     
@@ -201,11 +201,11 @@ class VAE:
             kernel_size = self.conv_kernels[layer_index],
             strides = self.conv_strides[layer_index],
             padding="same",
+            activation="relu",
             name=f"decoder_conv_transpose_layer_{layer_num}"
         )
 
         x = conv_transpose_layer(x)
-        x = ks.layers.ReLU(name=f"decoder_relu_{layer_num}")(x)
         x = ks.layers.BatchNormalization(name=f"decoder_bn_{layer_num}")(x)
 
         return x
@@ -222,7 +222,9 @@ class VAE:
         )
 
         x = conv_transpose_layer(x)
-        output_layer = ks.layers.Activation("sigmoid", name="sigmoid_layer")(x)
+        # keep the output in float32 so the loss is stable under mixed precision
+        output_layer = ks.layers.Activation("sigmoid", dtype="float32",
+                                            name="sigmoid_layer")(x)
 
         return output_layer
 
@@ -254,7 +256,7 @@ class VAE:
     def _add_conv_layer(self, layer_index, x):
         """
         Adds a convolutional block to a graph of layers, consisting of
-        conv 2d + ReLU + batch normalization layer
+        conv 2d (with ReLU) + batch normalization layer
         """
 
         layer_number = layer_index + 1
@@ -264,11 +266,11 @@ class VAE:
             kernel_size = self.conv_kernels[layer_index],
             strides = self.conv_strides[layer_index],
             padding = "same",
+            activation = "relu",
             name = f"encoder_conv_layer_{layer_number}"
         )
 
         x = conv_layer(x)
-        x = ks.layers.ReLU(name=f"encoder_relu_{layer_number}")(x)
         x = ks.layers.BatchNormalization(name=f"encoder_bn_{layer_number}")(x)
 
         return x
@@ -283,20 +285,25 @@ class VAE:
         self._shape_before_bottleneck = x.shape[1:]
         x = ks.layers.Flatten()(x)
 
-        self.mu = ks.layers.Dense(self.latent_space_dim, name="mu")(x)
+        # float32 so exp(log_variance) in the KL loss doesn't overflow
+        self.mu = ks.layers.Dense(self.latent_space_dim, dtype="float32",
+                                  name="mu")(x)
         self.log_variance = ks.layers.Dense(self.latent_space_dim,
+                                            dtype="float32",
                                             name="log_variance")(x)
         
 
         def sample_point_from_normal_distribution(args):
             mu, log_variance = args
-            epsilon = ks.random.normal(shape=ks.ops.shape(self.mu),
-                                       mean=0.0, stddev=1.0)
+            epsilon = ks.random.normal(shape=ks.ops.shape(mu),
+                                       mean=0.0, stddev=1.0, dtype=mu.dtype)
             sampled_point = mu + ks.ops.exp(log_variance / 2) * epsilon
             return sampled_point
 
 
+        # sample in float32 like the mu/log_variance heads feeding it
         x = ks.layers.Lambda(sample_point_from_normal_distribution,
+                             dtype="float32",
                              name="encoder_output",
                              output_shape=(self.latent_space_dim,)
                              )([self.mu, self.log_variance])
@@ -1,4 +1,5 @@
 import keras as ks
+import tensorflow as tf
 
 from autoencoder import VAE
 
@@ -9,14 +10,17 @@ BATCH_SIZE = 32
 EPOCHS = 100
 
 
-
 def load_mnist():
     
     (x_train, y_train), (x_test, y_test) = ks.datasets.mnist.load_data()
     
-    x_train = x_train.astype("float32") / 255
+    # astype allocates the float32 buffer once, scaling in place avoids a
+    # second full-array copy and reshape only returns a view
+    x_train = x_train.astype("float32")
+    x_train /= 255
     x_train = x_train.reshape(x_train.shape + (1,))
-    x_test = x_test.astype("float32") / 255
+    x_test = x_test.astype("float32")
+    x_test /= 255
     x_test = x_test.reshape(x_test.shape + (1,))
 
     return x_train, y_train, x_test, y_test
@@ -25,6 +29,11 @@ def load_mnist():
 
 def train(x_train, learning_rate, batch_size, epochs):
 
+    # float16 convs only pay off on GPU tensor cores, and keras wraps the
+    # optimizer with dynamic loss scaling under this policy
+    if tf.config.list_physical_devices("GPU"):
+        ks.mixed_precision.set_global_policy("mixed_float16")
+
     autoencoder = VAE(
         input_shape=(28, 28, 1),
         conv_filters=(32, 64, 64, 64),